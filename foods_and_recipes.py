@@ -1,10 +1,14 @@
 # foods_and_recipes.py
 from __future__ import annotations
 
-from typing import Dict, List
-import pandas as pd
+from enum import IntEnum, auto
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, Mapping, Tuple
 
-from nutrition_models import FoodCategory, FoodItem
+from nutrition_models import FoodCategory, FoodItem, Recipe
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # Units:
@@ -84,7 +88,7 @@ roasted_butternut_squash = FoodItem(
 )
 
 
-FOODS: List[FoodItem] = [
+FOODS: Tuple[FoodItem, ...] = (
     cooked_chicken_breast,
     cooked_chicken_thigh,
     cooked_white_rice,
@@ -92,23 +96,65 @@ FOODS: List[FoodItem] = [
     green_beans,
     cooked_carrots,
     roasted_butternut_squash,
-]
+)
 
-FOODS_BY_NAME: Dict[str, FoodItem] = {f.name: f for f in FOODS}
+FOODS_BY_NAME: Mapping[str, FoodItem] = MappingProxyType({f.name: f for f in FOODS})
+
+
+class FoodKey(IntEnum):
+    """Short keys for FOODS."""
+    CHICKEN_BREAST = auto()
+    CHICKEN_THIGH = auto()
+    WHITE_RICE = auto()
+    MIXED_VEGETABLES = auto()
+    GREEN_BEANS = auto()
+    CARROTS = auto()
+    BUTTERNUT_SQUASH = auto()
+
+
+# Prefer this over FOODS_BY_NAME in code; the long names are for display.
+FOODS_BY_KEY: Mapping[FoodKey, FoodItem] = MappingProxyType(
+    {
+        FoodKey.CHICKEN_BREAST: cooked_chicken_breast,
+        FoodKey.CHICKEN_THIGH: cooked_chicken_thigh,
+        FoodKey.WHITE_RICE: cooked_white_rice,
+        FoodKey.MIXED_VEGETABLES: mixed_vegetables,
+        FoodKey.GREEN_BEANS: green_beans,
+        FoodKey.CARROTS: cooked_carrots,
+        FoodKey.BUTTERNUT_SQUASH: roasted_butternut_squash,
+    }
+)
 
 
 # --- Convenience DataFrames for the notebook ---
 
 def foods_df() -> pd.DataFrame:
-    rows = []
-    for f in FOODS:
-        rows.append(
-            {
-                "name": f.name,
-                "category": f.category.name,
-                "kj_per_kg": f.kj_per_kg,
-                "dollars_per_kg": f.dollars_per_kg,
-                "notes": f.notes,
-            }
-        )
-    return pd.DataFrame(rows)
+    import pandas as pd  # deferred so importing FOODS doesn't pull in pandas
+
+    return pd.DataFrame(
+        {
+            "name": [f.name for f in FOODS],
+            "category": [f.category.name for f in FOODS],
+            "kj_per_kg": [f.kj_per_kg for f in FOODS],
+            "dollars_per_kg": [f.dollars_per_kg for f in FOODS],
+            "notes": [f.notes for f in FOODS],
+        }
+    )
+
+
+def all_recipe_totals(recipes: Iterable[Recipe]) -> pd.DataFrame:
+    """
+    Energy and cost totals for many recipes as one DataFrame, built column-wise
+    from each Recipe's cached totals (no per-ingredient work).
+    """
+    import pandas as pd
+
+    recipes = list(recipes)
+    return pd.DataFrame(
+        {
+            "name": [r.name for r in recipes],
+            "total_kj": [r.total_kj for r in recipes],
+            "total_kcal": [r.total_kcal for r in recipes],
+            "total_cost": [r.total_cost for r in recipes],
+        }
+    )
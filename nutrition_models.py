@@ -1,21 +1,29 @@
 # nutrition_models.py
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, TypeVar
 from datetime import date
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# Scalar in -> scalar out; NumPy array in -> array out (element-wise).
+_Num = TypeVar("_Num", float, "np.ndarray")
+
 # --- Constants and conversions ---
 
 KJ_PER_KCAL = 4.184
+KCAL_PER_KJ = 1.0 / KJ_PER_KCAL
 
 
-def kcal_to_kj(kcal: float) -> float:
+def kcal_to_kj(kcal: _Num) -> _Num:
     return kcal * KJ_PER_KCAL
 
 
-def kj_to_kcal(kj: float) -> float:
-    return kj / KJ_PER_KCAL
+def kj_to_kcal(kj: _Num) -> _Num:
+    return kj * KCAL_PER_KJ
 
 
 # --- Core enums and dataclasses ---
@@ -29,11 +37,14 @@ class FoodCategory(Enum):
     OTHER = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class FoodItem:
     """
     Energy: kJ/kg (SI)
     Cost: dollars/kg (CAD or whatever you want)
+
+    Items are module-level singletons, so equality and hashing are by
+    identity rather than by comparing every field.
     """
     name: str
     category: FoodCategory
@@ -41,50 +52,78 @@ class FoodItem:
     dollars_per_kg: float
     notes: str = ""
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", sys.intern(self.name))
+        # Per-gram rates are constant for a frozen item; precompute them once.
+        # Declared here rather than as fields so fields()/asdict() don't see them.
+        self._kj_per_g: float
+        self._dollars_per_g: float
+        object.__setattr__(self, "_kj_per_g", self.kj_per_kg * 1e-3)
+        object.__setattr__(self, "_dollars_per_g", self.dollars_per_kg * 1e-3)
+
     @property
     def kj_per_gram(self) -> float:
-        return self.kj_per_kg / 1000.0
+        return self._kj_per_g
 
     def energy_kj(self, grams: float) -> float:
-        return self.kj_per_gram * grams
+        return self._kj_per_g * grams
 
     def energy_kcal(self, grams: float) -> float:
-        return kj_to_kcal(self.energy_kj(grams))
+        return kj_to_kcal(self._kj_per_g * grams)
 
     def cost(self, grams: float) -> float:
-        return self.dollars_per_kg * (grams / 1000.0)
+        return self._dollars_per_g * grams
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecipeIngredient:
     food: FoodItem
     grams: float
+    # Derived once at construction; frozen so they can't go stale.
+    energy_kj: float = field(init=False, repr=False, compare=False)
+    energy_kcal: float = field(init=False, repr=False, compare=False)
+    cost: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def energy_kj(self) -> float:
-        return self.food.energy_kj(self.grams)
-
-    @property
-    def energy_kcal(self) -> float:
-        return self.food.energy_kcal(self.grams)
-
-    @property
-    def cost(self) -> float:
-        return self.food.cost(self.grams)
+    def __post_init__(self) -> None:
+        energy_kj = self.food.energy_kj(self.grams)
+        object.__setattr__(self, "energy_kj", energy_kj)
+        object.__setattr__(self, "energy_kcal", kj_to_kcal(energy_kj))
+        object.__setattr__(self, "cost", self.food.cost(self.grams))
 
 
 @dataclass
 class Recipe:
+    """
+    ingredients is a tuple (it used to be a list): build it up with add(), or
+    assign a new tuple; in-place edits like .append()/.sort() are not supported.
+    """
     name: str
-    ingredients: List[RecipeIngredient] = field(default_factory=list)
+    ingredients: Tuple[RecipeIngredient, ...] = ()
     notes: str = ""
 
+    def __post_init__(self) -> None:
+        self.ingredients = tuple(self.ingredients)
+        # Cached totals (plain attributes, not dataclass fields), valid only
+        # for the exact ingredients tuple they were computed from.
+        self._totals_for: Optional[Tuple[RecipeIngredient, ...]] = None
+        self._total_kj = 0.0
+        self._total_cost = 0.0
+
     def add(self, food: FoodItem, grams: float) -> None:
-        self.ingredients.append(RecipeIngredient(food, grams))
+        # A new tuple, which also invalidates the cached totals.
+        self.ingredients = self.ingredients + (RecipeIngredient(food, grams),)
+
+    def _refresh_totals(self) -> None:
+        if self._totals_for is not self.ingredients:
+            ings = self.ingredients
+            self._total_kj = sum(ing.energy_kj for ing in ings)
+            self._total_cost = sum(ing.cost for ing in ings)
+            self._totals_for = ings
 
     @property
     def total_kj(self) -> float:
-        return sum(ing.energy_kj for ing in self.ingredients)
+        self._refresh_totals()
+        return self._total_kj
 
     @property
     def total_kcal(self) -> float:
@@ -92,7 +131,8 @@ class Recipe:
 
     @property
     def total_cost(self) -> float:
-        return sum(ing.cost for ing in self.ingredients)
+        self._refresh_totals()
+        return self._total_cost
 
     def energy_kj_by_food(self) -> Dict[str, float]:
         out: Dict[str, float] = {}
@@ -118,7 +158,7 @@ class DogProfile:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WeightEntry:
     day: date
     weight_kg: float
@@ -127,15 +167,17 @@ class WeightEntry:
 
 # --- Calorie (kcal) math for RER / weight loss ---
 
-def rer_kg(weight_kg: float) -> float:
+def rer_kg(weight_kg: _Num) -> _Num:
     """
     Resting Energy Requirement (kcal/day) = 70 * kg^0.75
     Uses kcal because that’s how the veterinary formulas are defined.
+    Also accepts a NumPy array of weights (e.g. a weight trajectory) and
+    evaluates element-wise, so no Python-level loop is needed for sweeps.
     """
     return 70.0 * (weight_kg ** 0.75)
 
 
-def weight_loss_target_kcal(ideal_weight_kg: float, factor: float = 0.8) -> float:
+def weight_loss_target_kcal(ideal_weight_kg: _Num, factor: float = 0.8) -> _Num:
     """
     Typical guideline: feed ~80% of ideal-weight RER for weight loss.
     Returns kcal/day.
@@ -143,14 +185,14 @@ def weight_loss_target_kcal(ideal_weight_kg: float, factor: float = 0.8) -> floa
     return rer_kg(ideal_weight_kg) * factor
 
 
-def weight_loss_target_kj(ideal_weight_kg: float, factor: float = 0.8) -> float:
+def weight_loss_target_kj(ideal_weight_kg: _Num, factor: float = 0.8) -> _Num:
     """
     Same as weight_loss_target_kcal, but in kJ/day.
     """
     return kcal_to_kj(weight_loss_target_kcal(ideal_weight_kg, factor=factor))
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyMealPlan:
     day: date
     recipes: List[Recipe] = field(default_factory=list)
@@ -174,10 +216,21 @@ class DailyMealPlan:
 def grocery_list_from_plans(plans: List[DailyMealPlan]) -> Dict[FoodItem, float]:
     """
     Returns mapping FoodItem -> total grams across the given plans.
+    Plans usually repeat the same Recipe objects, so each distinct recipe's
+    ingredients are walked once and scaled by how often it is served.
     """
-    totals: Dict[FoodItem, float] = {}
+    servings: Dict[int, int] = {}
+    distinct: Dict[int, Recipe] = {}
     for plan in plans:
         for recipe in plan.recipes:
-            for ing in recipe.ingredients:
-                totals[ing.food] = totals.get(ing.food, 0.0) + ing.grams
+            key = id(recipe)
+            servings[key] = servings.get(key, 0) + 1
+            distinct[key] = recipe
+
+    totals: Dict[FoodItem, float] = {}
+    for key, recipe in distinct.items():
+        n = servings[key]
+        for ing in recipe.ingredients:
+            food = ing.food
+            totals[food] = totals.get(food, 0.0) + ing.grams * n
     return totals